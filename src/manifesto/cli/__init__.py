@@ -0,0 +1,22 @@
+"""CLI subcommands, imported on demand by the top-level group"""
+
+_console_instance = None
+
+def _console():
+    """Return the shared Rich console, importing Rich on first use"""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
+
+def _table():
+    """Return the Rich Table class, importing it on first use"""
+    from rich.table import Table
+    return Table
+
+def _load_manifest(path) -> dict:
+    """Load a manifesto file; raises FileNotFoundError if it is missing"""
+    from ..core._yaml import safe_load
+    with open(path, 'rb') as f:
+        return safe_load(f)
@@ -0,0 +1,23 @@
+import click
+import sys
+from pathlib import Path
+from . import _console
+
+@click.command()
+@click.option('--type', default='visionos', help='Project type')
+@click.option('--name', required=True, help='Project name')
+@click.option('--path', default='.', help='Project path')
+def init(type, name, path):
+    """Initialize a new project with manifesto"""
+    from ..core.injector import inject_manifesto
+    _console().print(f"[bold green]Initializing {type} project: {name}[/bold green]")
+    
+    project_path = Path.cwd() if path == '.' else Path(path).resolve()
+    success = inject_manifesto(project_path, name, type)
+    
+    if success:
+        _console().print("✅ Manifesto initialized successfully")
+        _console().print(f"📁 Created at: {project_path}/docs/_MANIFESTO/")
+    else:
+        _console().print("[bold red]❌ Failed to initialize manifesto[/bold red]")
+        sys.exit(1)
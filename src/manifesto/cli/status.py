@@ -0,0 +1,15 @@
+import click
+from pathlib import Path
+from . import _console, _load_manifest
+
+@click.command()
+def status():
+    """Show manifesto status"""
+    try:
+        data = _load_manifest(Path("docs/_MANIFESTO/manifesto.yaml"))
+    except FileNotFoundError:
+        _console().print("[red]No manifesto found in current directory[/red]")
+        return
+    _console().print(f"[bold]Project:[/bold] {data['title']}")
+    _console().print(f"[bold]Status:[/bold] {data['status']}")
+    _console().print(f"[bold]Tasks:[/bold] {len(data.get('tasks', []))}")
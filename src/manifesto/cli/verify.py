@@ -0,0 +1,47 @@
+import click
+import sys
+from pathlib import Path
+from . import _console, _table, _load_manifest
+
+@click.command()
+@click.argument('task_id')
+@click.option('--manifest', default='docs/_MANIFESTO/manifesto.yaml', help='Manifesto file')
+@click.option('--json/--table', 'as_json', default=None,
+              help='Output format (default: table on a terminal, JSON otherwise)')
+def verify(task_id, manifest, as_json):
+    """Verify a task was completed correctly"""
+    from ..verify.swift import SwiftVerifier
+    if as_json is None:
+        as_json = not sys.stdout.isatty()
+    if not as_json:
+        _console().print(f"[bold blue]Verifying task {task_id}...[/bold blue]")
+    
+    try:
+        data = _load_manifest(Path(manifest))
+    except FileNotFoundError:
+        click.echo(f"❌ Manifesto not found at {manifest}", err=True)
+        sys.exit(1)
+    
+    verifier = SwiftVerifier(data)
+    passed, results = verifier.verify_task(task_id)
+    
+    if as_json:
+        # Piped/CI use: skip Rich rendering entirely
+        import json
+        click.echo(json.dumps({"task_id": task_id, "passed": passed, "results": results}, indent=2))
+    else:
+        # Display results table
+        rows = [
+            (check, "✅ PASS" if result['passed'] else "❌ FAIL", result.get('details', ''))
+            for check, result in results.items()
+        ]
+        table = _table()(title=f"Task {task_id} Verification")
+        table.add_column("Check", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Details")
+        for row in rows:
+            table.add_row(*row)
+        _console().print(table)
+    
+    if not passed:
+        sys.exit(1)
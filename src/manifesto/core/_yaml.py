@@ -0,0 +1,8 @@
+"""YAML helpers that prefer the libyaml C bindings when PyYAML has them"""
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def safe_load(stream):
+    """yaml.safe_load, parsed by libyaml when available"""
+    return yaml.load(stream, Loader=SafeLoader)
@@ -1,38 +1,30 @@
-import shutil
+import functools
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-import yaml
+from jinja2 import Template
 from datetime import datetime
 
 def inject_manifesto(project_path: Path, project_name: str, project_type: str) -> bool:
     """Inject manifesto into project"""
     try:
-        # Create manifesto directory
+        # Create manifesto directory; the leaf dirs imply their parents
         manifesto_dir = project_path / "docs" / "_MANIFESTO"
-        manifesto_dir.mkdir(parents=True, exist_ok=True)
+        for subdir in ("tasks", "reviews"):
+            (manifesto_dir / subdir).mkdir(parents=True, exist_ok=True)
         
-        # Get template path
-        template_dir = Path(__file__).parent.parent / "templates"
-        template_dir.mkdir(exist_ok=True)
-        
-        # Read or create template
-        template_content = get_template_content()
-        
-        # Create Jinja2 template
-        from jinja2 import Template
-        template = Template(template_content)
+        # Compiled template, cached after the first call
+        template = _get_template()
         
         # Render with project specifics
+        now = datetime.now()
         content = template.render(
-            project_id=f"PRD-{datetime.now().year}-{project_name.upper()[:3]}-AVP",
+            project_id=f"PRD-{now.year}-{project_name.upper()[:3]}-AVP",
             title=project_name,
             project_type=project_type,
-            date=datetime.now().strftime("%Y-%m-%d")
+            date=now.strftime("%Y-%m-%d")
         )
         
         # Write manifesto
-        with open(manifesto_dir / "manifesto.yaml", "w") as f:
-            f.write(content)
+        (manifesto_dir / "manifesto.yaml").write_bytes(content.encode("utf-8"))
         
         # Create supporting files
         readme_content = f"""# {project_name} Manifesto
@@ -51,18 +43,21 @@ manifesto status
 ```
 """
         (manifesto_dir / "README.md").write_text(readme_content)
-        (manifesto_dir / "tasks").mkdir(exist_ok=True)
-        (manifesto_dir / "reviews").mkdir(exist_ok=True)
         
         # Create .gitkeep files
-        (manifesto_dir / "tasks" / ".gitkeep").touch()
-        (manifesto_dir / "reviews" / ".gitkeep").touch()
+        (manifesto_dir / "tasks" / ".gitkeep").write_bytes(b"")
+        (manifesto_dir / "reviews" / ".gitkeep").write_bytes(b"")
         
         return True
     except Exception as e:
         print(f"Injection error: {e}")
         return False
 
+@functools.lru_cache(maxsize=None)
+def _get_template():
+    """Compile the manifesto template once and reuse it"""
+    return Template(get_template_content())
+
 def get_template_content():
     """Get the manifesto template"""
     return '''# AUTO-GENERATED MANIFESTO - DO NOT EDIT HEADER
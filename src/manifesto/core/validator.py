@@ -1,7 +1,10 @@
-from pydantic import BaseModel, Field
+import logging
+from pydantic import BaseModel, Field, ValidationError
 from typing import List, Dict, Optional, Literal, Any
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class AcceptanceCriteria(BaseModel):
     file_exists: Optional[List[str]] = None
     file_contains: Optional[Dict[str, str]] = None
@@ -37,8 +40,9 @@ class ManifestoSchema(BaseModel):
 def validate_manifesto(data: dict) -> bool:
     """Validate manifesto against schema"""
     try:
-        ManifestoSchema(**data)
+        ManifestoSchema.model_validate(data)
         return True
-    except Exception as e:
-        print(f"Validation error: {e}")
+    except ValidationError as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Manifesto invalid: %s", e.errors())
         return False
@@ -6,68 +6,38 @@ import json
 from datetime import datetime
 from typing import Dict, Tuple, Any, List
 
-from datetime import datetime
+# Digest used for file hashes in verification proofs
+HASH_ALGORITHM = "sha256"
 
 class BaseVerifier(ABC):
     def __init__(self, manifest: dict):
         self.manifest = manifest
+        # Index tasks by id; the first definition wins, as with a linear scan
+        self._tasks_by_id = {}
+        for t in manifest.get('tasks') or []:
+            self._tasks_by_id.setdefault(t.get('id'), t)
         
     def verify_task(self, task_id: str) -> Tuple[bool, Dict[str, Any]]:
         """Verify a specific task"""
-        # Find task
-        task = None
-        for t in self.manifest.get('tasks', []):
-            if t['id'] == task_id:
-                task = t
-                break
-                
+        task = self._tasks_by_id.get(task_id)
         if not task:
             return False, {"error": {"passed": False, "details": f"Task {task_id} not found"}}
         
         results = {}
         acceptance = task.get('acceptance', {})
         
-        # Check file existence
-        if 'file_exists' in acceptance:
-            for file_path in acceptance['file_exists']:
-                exists = Path(file_path).exists()
-                results[f"file_{Path(file_path).name}"] = {
-                    "passed": exists,
-                    "details": f"{'Found' if exists else 'Missing'}: {file_path}"
-                }
-        
-        # Check file contents
-        if 'file_contains' in acceptance:
-            for file_path, pattern in acceptance['file_contains'].items():
-                if Path(file_path).exists():
-                    content = Path(file_path).read_text()
-                    found = pattern in content
-                    results[f"contains_{pattern[:20]}"] = {
-                        "passed": found,
-                        "details": f"Pattern {'found' if found else 'not found'} in {file_path}"
-                    }
-                else:
-                    results[f"contains_{pattern[:20]}"] = {
-                        "passed": False,
-                        "details": f"File not found: {file_path}"
-                    }
+        # Check file existence and contents
+        for file_path in acceptance.get('file_exists') or []:
+            key, result = self._check_file_exists(file_path)
+            results[key] = result
+        for file_path, pattern in (acceptance.get('file_contains') or {}).items():
+            key, result = self._check_file_contains(file_path, pattern)
+            results[key] = result
         
         # Run commands
-        if 'command_succeeds' in acceptance:
-            for cmd in acceptance['command_succeeds']:
-                try:
-                    result = subprocess.run(cmd, shell=True, capture_output=True, timeout=30)
-                    passed = result.returncode == 0
-                    output = result.stdout.decode()[:100] if passed else result.stderr.decode()[:100]
-                    results[f"cmd_{cmd.split()[0]}"] = {
-                        "passed": passed,
-                        "details": output.strip()
-                    }
-                except Exception as e:
-                    results[f"cmd_{cmd.split()[0]}"] = {
-                        "passed": False,
-                        "details": str(e)
-                    }
+        for cmd in acceptance.get('command_succeeds') or []:
+            key, result = self._run_command(cmd)
+            results[key] = result
         
         # Check if tests pass
         if 'test_passes' in acceptance:
@@ -84,6 +54,46 @@ class BaseVerifier(ABC):
         all_passed = all(r['passed'] for r in results.values())
         return all_passed, results
     
+    def _check_file_exists(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
+        """Check that an acceptance file exists"""
+        exists = Path(file_path).exists()
+        return f"file_{Path(file_path).name}", {
+            "passed": exists,
+            "details": f"{'Found' if exists else 'Missing'}: {file_path}"
+        }
+    
+    def _check_file_contains(self, file_path: str, pattern: str) -> Tuple[str, Dict[str, Any]]:
+        """Check that an acceptance file contains a pattern"""
+        key = f"contains_{pattern[:20]}"
+        if not Path(file_path).exists():
+            return key, {
+                "passed": False,
+                "details": f"File not found: {file_path}"
+            }
+        found = pattern in Path(file_path).read_text()
+        return key, {
+            "passed": found,
+            "details": f"Pattern {'found' if found else 'not found'} in {file_path}"
+        }
+    
+    def _run_command(self, cmd: str) -> Tuple[str, Dict[str, Any]]:
+        """Run an acceptance command and report whether it succeeded"""
+        key = f"cmd_{cmd.split()[0]}"
+        try:
+            result = subprocess.run(cmd, shell=True, capture_output=True, text=False, timeout=30)
+            passed = result.returncode == 0
+            # Only the head is reported, so slice before decoding the bytes
+            output = (result.stdout if passed else result.stderr)[:100].decode('utf-8', errors='replace')
+            return key, {
+                "passed": passed,
+                "details": output.strip()
+            }
+        except Exception as e:
+            return key, {
+                "passed": False,
+                "details": str(e)
+            }
+    
     def save_verification_proof(self, task_id: str, results: Dict[str, Any]):
         """Save cryptographic proof of task completion"""
         proof_dir = Path("docs/_MANIFESTO/tasks")
@@ -93,15 +103,15 @@ class BaseVerifier(ABC):
             "task_id": task_id,
             "timestamp": datetime.now().isoformat(),
             "results": results,
+            "hash_algorithm": HASH_ALGORITHM,
             "file_hashes": {}
         }
         
         # Hash relevant files
-        for t in self.manifest.get('tasks', []):
-            if t['id'] == task_id:
-                for f in t.get('acceptance', {}).get('file_exists', []):
-                    if Path(f).exists():
-                        proof['file_hashes'][f] = self.hash_file(f)
+        task = self._tasks_by_id.get(task_id, {})
+        for f in task.get('acceptance', {}).get('file_exists') or []:
+            if Path(f).exists():
+                proof['file_hashes'][f] = self.hash_file(f)
         
         with open(proof_dir / f"{task_id}_proof.json", "w") as f:
             json.dump(proof, f, indent=2)
@@ -112,8 +122,9 @@ class BaseVerifier(ABC):
         pass
     
     def hash_file(self, file_path: str) -> str:
-        """Generate SHA256 hash of file"""
+        """Generate SHA256 hash of file, streamed in chunks"""
         try:
-            return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
-        except:
+            with open(file_path, "rb") as f:
+                return hashlib.file_digest(f, HASH_ALGORITHM).hexdigest()
+        except OSError:
             return "error"
@@ -1,9 +1,35 @@
 import subprocess
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Iterator
 from .base import BaseVerifier
 
+# Build products and VCS metadata never hold project sources
+_SKIP_DIRS = {".git", ".build", "build", "DerivedData"}
+# Files above this size are scanned through mmap instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+def _swift_sources(root: str = ".") -> Iterator[str]:
+    """Yield .swift file paths under root, pruning build and VCS dirs"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.endswith(".swift"):
+                yield os.path.join(dirpath, name)
+
+def _file_contains(path: str, needle: bytes) -> bool:
+    """Check whether a file contains needle without decoding it"""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(needle) != -1
+            return needle in f.read()
+    except OSError:
+        return False
+
 class SwiftVerifier(BaseVerifier):
     def run_tests(self, test_spec: str) -> Tuple[bool, str]:
         """Run Swift tests"""
@@ -18,12 +44,10 @@ class SwiftVerifier(BaseVerifier):
         """Verify Vision Pro specific setup"""
         checks = {}
         
-        # Check for RealityKit imports
-        swift_files = list(Path(".").rglob("*.swift"))
+        # Check for RealityKit imports, stopping at the first file that has one
         has_realitykit = any(
-            "import RealityKit" in f.read_text() 
-            for f in swift_files
-            if f.exists()
+            _file_contains(path, b"import RealityKit")
+            for path in _swift_sources()
         )
         checks['realitykit_imported'] = has_realitykit
         